@@ -1,67 +1,345 @@
 import os
+import re
 import subprocess
 import json
-import sys
+import stat
+import fnmatch
+import argparse
+import contextvars
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import namedtuple
 from datetime import datetime
 
 # Path to your repo
 REPO_PATH = r"C:\Users\admin\vauntico-mvp"
 OUTPUT_FILE = os.path.join(REPO_PATH, "daily_digest.md")
 
-def get_repo_tree(path, depth=2):
+# Machine-readable timing report written next to the digest on every run
+REPORT_FILE = os.path.splitext(OUTPUT_FILE)[0] + ".profile.json"
+
+# Per-section cache used by --incremental and --watch
+CACHE_DIR = os.path.join(REPO_PATH, ".digest_cache")
+CACHE_FILE = os.path.join(CACHE_DIR, "sections.json")
+CACHE_VERSION = 3
+
+# Process umask, read once at startup because os.umask() can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Seconds that cached GitHub query sections stay fresh
+GITHUB_TTL = 900
+
+# Timeouts in seconds: per subprocess, and per collector (which may run several)
+COMMAND_TIMEOUT = 30
+COLLECTOR_TIMEOUT = 60
+
+# Upper bound on gh/git subprocesses running at once, across all repos in a batch
+MAX_CONCURRENT_COMMANDS = 8
+_command_slots = threading.BoundedSemaphore(MAX_CONCURRENT_COMMANDS)
+
+# Default number of repositories built concurrently by --batch
+BATCH_WORKERS = 4
+
+# GitHub owners with several repositories in the current batch; their labelled
+# issues are fetched with one org-wide search per label instead of one list per repo
+ORG_SEARCH_LIMIT = 1000
+_shared_orgs = set()
+
+# Shared results of gh/git queries, keyed by command line and working directory
+_query_cache = {}
+_query_lock = threading.Lock()
+
+# Stats of the collector running in the current thread, if any
+_current_stats = contextvars.ContextVar("digest_collector_stats", default=None)
+
+# Directories never shown in the repo map, whatever .gitignore says
+IGNORED_DIRS = {'node_modules', '.git', '__pycache__', 'dist', 'build', '.digest_cache'}
+
+# Directories below the root with more files than this are shown as a count
+MAX_LISTED_FILES = 50
+
+DEFAULT_MISSION = "Phase 2: Monetization (Months 4-6) - Activating Pro tier subscriptions ($49/month) and Trust Score Insurance add-on ($19/month) to achieve first $10K MRR milestone."
+
+def load_ignore_rules(directory):
+    """Parse a directory's .gitignore into (pattern, negate, dir_only, anchored, base) rules"""
+    rules = []
+    try:
+        with open(os.path.join(directory, ".gitignore"), encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return rules
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        # A slash anywhere but the end anchors the pattern to the .gitignore's directory
+        anchored = "/" in line
+        line = line.lstrip("/")
+        if line.startswith("**/"):
+            line, anchored = line[3:], "/" in line[3:]
+        if line:
+            rules.append((line, negate, dir_only, anchored, directory))
+    return rules
+
+def match_segments(parts, segments):
+    """Match path segments against pattern segments; `*` stays within a segment, `**` spans any number"""
+    if not parts:
+        return not segments
+    if parts[0] == "**":
+        return any(match_segments(parts[1:], segments[i:]) for i in range(len(segments) + 1))
+    return bool(segments) and fnmatch.fnmatch(segments[0], parts[0]) and match_segments(parts[1:], segments[1:])
+
+def is_ignored(path, is_dir, rules):
+    """Apply gitignore-style rules to a path; the last matching rule wins"""
+    name = os.path.basename(path)
+    if is_dir and name in IGNORED_DIRS:
+        return True
+
+    ignored = False
+    for pattern, negate, dir_only, anchored, base in rules:
+        if dir_only and not is_dir:
+            continue
+        if anchored:
+            matched = match_segments(pattern.split("/"), os.path.relpath(path, base).replace(os.sep, "/").split("/"))
+        else:
+            matched = fnmatch.fnmatch(name, pattern)
+        if matched:
+            ignored = not negate
+    return ignored
+
+def get_repo_tree(path, depth=2, max_files=MAX_LISTED_FILES, visited=None, exclude=()):
+    """Render the repo tree to `depth` levels, pruning ignored directories without walking them.
+
+    Paths in `exclude` (e.g. the generator's own output files) are left out of the tree.
+    """
     tree = []
-    for root, dirs, files in os.walk(path):
-        level = root.replace(path, "").count(os.sep)
-        if level < depth:
-            indent = " " * 2 * level
-            tree.append(f"{indent}{os.path.basename(root)}/")
-            subindent = " " * 2 * (level + 1)
-            for f in files:
-                # Skip hidden files and common non-source files
-                if not f.startswith('.') and f not in ['node_modules', '.git', '__pycache__', 'dist', 'build']:
-                    tree.append(f"{subindent}{f}")
+    excluded = {os.path.normcase(os.path.abspath(p)) for p in exclude}
+
+    def walk(directory, level, rules):
+        indent = " " * 2 * level
+        tree.append(f"{indent}{os.path.basename(directory)}/")
+        if visited is not None:
+            visited.append(directory)
+        rules = rules + load_ignore_rules(directory)
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name.lower())
+        except OSError:
+            return
+
+        files, subdirs = [], []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_ignored(entry.path, is_dir, rules):
+                continue
+            if os.path.normcase(os.path.abspath(entry.path)) in excluded:
+                continue
+            if is_dir:
+                subdirs.append(entry.path)
+            elif not entry.name.startswith('.'):
+                # Skip hidden files
+                files.append(entry.name)
+
+        subindent = " " * 2 * (level + 1)
+        if level > 0 and len(files) > max_files:
+            # Fold very large directories into a file count
+            tree.append(f"{subindent}({len(files)} files)")
+        else:
+            tree.extend(f"{subindent}{f}" for f in files)
+
+        if level + 1 < depth:
+            for subdir in subdirs:
+                walk(subdir, level + 1, rules)
+
+    if depth > 0:
+        walk(os.path.normpath(path), 0, [])
     return "\n".join(tree)
 
-def get_recent_commits(n=10):
+class CollectorStats:
+    """Timing, subprocess usage and outcome of one collector"""
+
+    def __init__(self, status="ok"):
+        self.status = status
+        self.error = None
+        self.wall_seconds = 0.0
+        self.subprocess_seconds = 0.0
+        self.queue_seconds = 0.0
+        self.commands_run = 0
+        self.commands_shared = 0
+        self.output_bytes = 0
+        self._lock = threading.Lock()
+
+    def record_command(self, seconds, shared, queued=0.0):
+        with self._lock:
+            if shared:
+                self.commands_shared += 1
+            else:
+                self.commands_run += 1
+                self.subprocess_seconds += seconds
+                self.queue_seconds += queued
+
+    def fall_back(self, error):
+        self.status = "fallback"
+        self.error = str(error)
+
+    def as_dict(self):
+        return {
+            "status": self.status,
+            "error": self.error,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "subprocess_seconds": round(self.subprocess_seconds, 4),
+            "queue_seconds": round(self.queue_seconds, 4),
+            "commands_run": self.commands_run,
+            "commands_shared": self.commands_shared,
+            "output_bytes": self.output_bytes,
+        }
+
+def note_fallback(error):
+    """Mark the running collector as having returned its fallback text"""
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.fall_back(error)
+
+def submit_in_context(pool, func, *args):
+    """Submit to a thread pool, carrying over the caller's collector stats"""
+    return pool.submit(contextvars.copy_context().run, func, *args)
+
+DigestPaths = namedtuple("DigestPaths", "repo_path output_file report_file cache_dir cache_file")
+
+def digest_paths(repo_path=None, output_file=None):
+    """Resolve where a repository's digest, profile report and section cache live"""
+    if repo_path is None:
+        return DigestPaths(REPO_PATH, OUTPUT_FILE, REPORT_FILE, CACHE_DIR, CACHE_FILE)
+    output_file = output_file or os.path.join(repo_path, "daily_digest.md")
+    cache_dir = os.path.join(repo_path, ".digest_cache")
+    return DigestPaths(
+        repo_path,
+        output_file,
+        os.path.splitext(output_file)[0] + ".profile.json",
+        cache_dir,
+        os.path.join(cache_dir, "sections.json"),
+    )
+
+def get_recent_commits(n=10, repo_path=None):
     try:
-        commits = subprocess.check_output(
-            ["git", "-C", REPO_PATH, "log", "--oneline", f"-n{n}"],
-            text=True
-        )
+        commits = run_query(["git", "-C", repo_path or REPO_PATH, "log", "--oneline", f"-n{n}"])
         return commits.strip()
     except Exception as e:
+        note_fallback(e)
         return f"Error fetching commits: {e}"
 
-def get_github_issues():
+def run_query(args, cwd=None, timeout=COMMAND_TIMEOUT):
+    """Run a command once per process; concurrent and later callers share its output"""
+    key = (tuple(args), cwd)
+    with _query_lock:
+        future = _query_cache.get(key)
+        owner = future is None
+        if owner:
+            future = _query_cache[key] = Future()
+
+    stats = _current_stats.get()
+    if not owner:
+        try:
+            return future.result()
+        finally:
+            if stats is not None:
+                stats.record_command(0.0, shared=True)
+
+    # Time spent waiting for a free slot is reported apart from the subprocess itself
+    queued_at = time.monotonic()
+    started = None
+    try:
+        with _command_slots:
+            started = time.monotonic()
+            future.set_result(subprocess.check_output(args, text=True, cwd=cwd, timeout=timeout))
+    except Exception as e:
+        future.set_exception(e)
+    finally:
+        if stats is not None:
+            finished = time.monotonic()
+            started = started if started is not None else finished
+            stats.record_command(finished - started, shared=False, queued=started - queued_at)
+    return future.result()
+
+def get_github_repo(repo_path):
+    """Return the owner/name of a checkout's GitHub origin, or None if it has none"""
+    try:
+        url = run_query(["git", "-C", repo_path, "config", "--get", "remote.origin.url"]).strip()
+    except Exception:
+        return None
+    match = re.search(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$", url)
+    return match.group(1) if match else None
+
+def run_gh(args, repo_path=None):
+    """Run a gh command for a checkout, addressed by GitHub repo so every checkout of it shares the result"""
+    repo_path = repo_path or REPO_PATH
+    slug = get_github_repo(repo_path)
+    if slug:
+        return run_query(["gh"] + args + ["--repo", slug])
+    return run_query(["gh"] + args, cwd=repo_path)
+
+def get_org_issues(org, label):
+    """Fetch open issues with a label across an owner's repositories, grouped by lowercased owner/name.
+
+    Returns None when the search hit ORG_SEARCH_LIMIT, since repos past the cut would look issue-free.
+    """
+    output = run_query([
+        "gh", "search", "issues", "--owner", org, "--label", label, "--state", "open",
+        "--sort", "created", "--order", "desc", "--limit", str(ORG_SEARCH_LIMIT),
+        "--json", "repository,number,title",
+    ])
+    issues = json.loads(output or "[]")
+    if len(issues) >= ORG_SEARCH_LIMIT:
+        return None
+    by_repo = {}
+    for issue in issues:
+        slug = issue["repository"]["nameWithOwner"].lower()
+        by_repo.setdefault(slug, []).append({"number": issue["number"], "title": issue["title"]})
+    return by_repo
+
+def get_issues(label, limit=20, repo_path=None):
+    """Fetch open issues with a label as a list of {number, title} dicts"""
+    slug = get_github_repo(repo_path or REPO_PATH)
+    owner = slug.split("/")[0].lower() if slug else None
+    if owner in _shared_orgs:
+        by_repo = get_org_issues(owner, label)
+        if by_repo is not None:
+            return by_repo.get(slug.lower(), [])[:limit]
+    output = run_gh(
+        ["issue", "list", "--limit", str(limit), "--state", "open", "--label", label, "--json", "number,title"],
+        repo_path
+    )
+    return json.loads(output or "[]")
+
+def get_github_issues(repo_path=None):
     """Fetch GitHub issues for blockers using gh CLI"""
     try:
-        # Get critical and high priority issues
-        critical_issues = subprocess.check_output(
-            ["gh", "issue", "list", "--limit", "20", "--state", "open", "--label", "critical", "--json", "number,title", "--jq", r'.[] | "#\(.number) \(.title) [CRITICAL]"'],
-            text=True,
-            cwd=REPO_PATH
-        )
-        
-        high_issues = subprocess.check_output(
-            ["gh", "issue", "list", "--limit", "15", "--state", "open", "--label", "high-priority", "--json", "number,title", "--jq", r'.[] | "#\(.number) \(.title) [HIGH]"'],
-            text=True,
-            cwd=REPO_PATH
-        )
-        
-        ci_issues = subprocess.check_output(
-            ["gh", "issue", "list", "--limit", "10", "--state", "open", "--label", "ci", "--json", "number,title", "--jq", r'.[] | "#\(.number) \(.title) [CI]"'],
-            text=True,
-            cwd=REPO_PATH
-        )
+        # Get critical, high priority and CI issues in parallel
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            critical = submit_in_context(pool, get_issues, "critical", 20, repo_path)
+            high = submit_in_context(pool, get_issues, "high-priority", 20, repo_path)
+            ci = submit_in_context(pool, get_issues, "ci", 10, repo_path)
+            critical_issues = critical.result()
+            high_issues = high.result()[:15]
+            ci_issues = ci.result()
         
         # Combine and format
         all_issues = []
-        if critical_issues.strip():
-            all_issues.extend(critical_issues.strip().split('\n'))
-        if high_issues.strip():
-            all_issues.extend(high_issues.strip().split('\n'))
-        if ci_issues.strip():
-            all_issues.extend(ci_issues.strip().split('\n'))
+        all_issues.extend(f"#{i['number']} {i['title']} [CRITICAL]" for i in critical_issues)
+        all_issues.extend(f"#{i['number']} {i['title']} [HIGH]" for i in high_issues)
+        all_issues.extend(f"#{i['number']} {i['title']} [CI]" for i in ci_issues)
         
         # Format as bullet points, limit to 10
         formatted_blockers = []
@@ -75,15 +353,15 @@ def get_github_issues():
             
     except Exception as e:
         print(f"Warning: Could not fetch GitHub issues: {e}")
+        note_fallback(e)
         return "- Unable to fetch GitHub issues (gh CLI not available or authentication required)"
 
-def get_workflow_failures():
+def get_workflow_failures(repo_path=None):
     """Check for recent workflow failures"""
     try:
-        failed_workflows = subprocess.check_output(
-            ["gh", "run", "list", "--limit", "5", "--status", "failure", "--created", "24 hours ago", "--json", "name,conclusion,createdAt", "--jq", r'.[] | "- \(.name) (\(.createdAt))"'],
-            text=True,
-            cwd=REPO_PATH
+        failed_workflows = run_gh(
+            ["run", "list", "--limit", "5", "--status", "failure", "--created", "24 hours ago", "--json", "name,conclusion,createdAt", "--jq", r'.[] | "- \(.name) (\(.createdAt))"'],
+            repo_path
         )
         
         if failed_workflows.strip():
@@ -93,18 +371,14 @@ def get_workflow_failures():
             
     except Exception as e:
         print(f"Warning: Could not fetch workflow failures: {e}")
+        note_fallback(e)
         return "- Unable to fetch workflow status (gh CLI not available or authentication required)"
 
-def get_deployment_status():
+def get_deployment_status(repo_path=None):
     """Determine deployment status based on blockers and workflow failures"""
     # This is a simplified version - could be enhanced to check actual deployment endpoints
     try:
-        critical_issues = subprocess.check_output(
-            ["gh", "issue", "list", "--limit", "20", "--state", "open", "--label", "critical", "--json", "number", "--jq", 'length'],
-            text=True,
-            cwd=REPO_PATH
-        )
-        critical_count = int(critical_issues.strip() or "0")
+        critical_count = len(get_issues("critical", repo_path=repo_path))
         
         if critical_count > 5:
             return "⚠️ BLOCKED - Critical blockers prevent deployment"
@@ -113,25 +387,16 @@ def get_deployment_status():
         else:
             return "✅ READY - No critical blockers identified"
             
-    except:
+    except Exception as e:
+        print(f"Warning: Could not determine deployment status: {e}")
+        note_fallback(e)
         return "🔍 UNKNOWN - Unable to determine deployment status"
 
-def get_dynamic_mission():
+def get_dynamic_mission(repo_path=None):
     """Adjust mission based on current blocker count"""
     try:
-        critical_issues = subprocess.check_output(
-            ["gh", "issue", "list", "--limit", "20", "--state", "open", "--label", "critical", "--json", "number", "--jq", 'length'],
-            text=True,
-            cwd=REPO_PATH
-        )
-        high_issues = subprocess.check_output(
-            ["gh", "issue", "list", "--limit", "20", "--state", "open", "--label", "high-priority", "--json", "number", "--jq", 'length'],
-            text=True,
-            cwd=REPO_PATH
-        )
-        
-        critical_count = int(critical_issues.strip() or "0")
-        high_count = int(high_issues.strip() or "0")
+        critical_count = len(get_issues("critical", repo_path=repo_path))
+        high_count = len(get_issues("high-priority", repo_path=repo_path))
         total_blockers = critical_count + high_count
         
         if total_blockers > 10:
@@ -139,59 +404,148 @@ def get_dynamic_mission():
         elif total_blockers > 5:
             return "Blocker cleanup and stabilization"
         else:
-            return "Phase 2: Monetization (Months 4-6) - Activating Pro tier subscriptions ($49/month) and Trust Score Insurance add-on ($19/month) to achieve first $10K MRR milestone."
+            return DEFAULT_MISSION
             
-    except:
-        return "Phase 2: Monetization (Months 4-6) - Activating Pro tier subscriptions ($49/month) and Trust Score Insurance add-on ($19/month) to achieve first $10K MRR milestone."
+    except Exception as e:
+        print(f"Warning: Could not determine mission from blockers: {e}")
+        note_fallback(e)
+        return DEFAULT_MISSION
 
-def main():
-    # Parse command line arguments for depth
-    depth = 2  # default
-    if len(sys.argv) > 1:
-        try:
-            depth = int(sys.argv[1])
-        except ValueError:
-            print(f"Invalid depth argument: {sys.argv[1]}. Using default depth of 2.")
-    
-    # Also check for environment variable (for GitHub Actions)
-    if 'DEPTH' in os.environ:
+def run_collector(func, stats):
+    """Run a collector in the current thread, recording its timing into `stats`"""
+    _current_stats.set(stats)
+    started = time.monotonic()
+    try:
+        value = func()
+    finally:
+        stats.wall_seconds = time.monotonic() - started
+    stats.output_bytes = len(str(value).encode("utf-8"))
+    return value
+
+def collect_sections(collectors, timeout=COLLECTOR_TIMEOUT, stats=None):
+    """Run independent collectors in parallel, substituting each one's fallback if it fails or times out.
+
+    Returns the section texts and the names of sections that fell back. Per-collector
+    timings are stored into `stats` when given.
+    """
+    results, failed = {}, set()
+    if stats is None:
+        stats = {}
+    if not collectors:
+        return results, failed
+
+    pool = ThreadPoolExecutor(max_workers=len(collectors))
+    started = time.monotonic()
+    futures = {}
+    for name, (func, fallback) in collectors.items():
+        stats[name] = CollectorStats()
+        # Each collector gets its own context so its stats don't leak into the others
+        futures[name] = pool.submit(contextvars.Context().run, run_collector, func, stats[name])
+
+    for name, future in futures.items():
+        fallback = collectors[name][1]
         try:
-            depth = int(os.environ['DEPTH'])
-        except ValueError:
-            pass
-    
-    repo_tree = get_repo_tree(REPO_PATH, depth)
-    commits = get_recent_commits()
-    today = datetime.now().strftime("%Y-%m-%d")
-    
-    # Get dynamic content
-    blockers = get_github_issues()
-    workflow_failures = get_workflow_failures()
-    deployment_status = get_deployment_status()
-    current_mission = get_dynamic_mission()
+            results[name] = future.result(timeout=max(0, started + timeout - time.monotonic()))
+        except FutureTimeoutError:
+            print(f"Warning: {name} timed out after {timeout}s")
+            results[name] = fallback
+            stats[name].status = "timeout"
+            stats[name].wall_seconds = time.monotonic() - started
+        except Exception as e:
+            print(f"Warning: {name} failed: {e}")
+            results[name] = fallback
+            stats[name].status = "error"
+            stats[name].error = str(e)
+        if stats[name].status != "ok":
+            failed.add(name)
+
+    # Don't wait for timed-out collectors; their subprocesses are bounded by COMMAND_TIMEOUT
+    pool.shutdown(wait=False)
+    return results, failed
 
-    digest = f"""You are working inside the Vauntico codebase. Before you act, always keep this context in mind:
+def reset_queries():
+    """Forget memoized gh/git output so the next collection sees current data"""
+    with _query_lock:
+        _query_cache.clear()
+
+def get_git_head(repo_path=None):
+    try:
+        return run_query(["git", "-C", repo_path or REPO_PATH, "rev-parse", "HEAD"]).strip()
+    except Exception:
+        return None
+
+def get_dir_mtimes(directories):
+    """Map each directory and its .gitignore to an mtime, or None if missing"""
+    mtimes = {}
+    for directory in directories:
+        for p in (directory, os.path.join(directory, ".gitignore")):
+            try:
+                mtimes[p] = os.stat(p).st_mtime_ns
+            except OSError:
+                mtimes[p] = None
+    return mtimes
+
+def is_section_fresh(name, entry, depth, head, now, github_ttl):
+    """Decide whether a cached section is still valid for the current inputs"""
+    inputs = entry.get("inputs", {})
+    if name == "repo_tree":
+        # Adding, removing or renaming entries bumps the containing directory's mtime
+        return inputs.get("depth") == depth and \
+            get_dir_mtimes(inputs.get("dirs", [])) == inputs.get("mtimes")
+    if name == "commits":
+        return head is not None and inputs.get("head") == head
+    return now - entry.get("built_at", 0) < github_ttl
+
+def load_section_cache(cache_file):
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get("version") == CACHE_VERSION else {}
+
+def write_atomic(path, content):
+    """Write via a temporary file and rename, so readers never see a partial file"""
+    # mkstemp creates files as 0600; keep the existing file's mode, or what open() would give
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = 0o666 & ~_UMASK
+
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def render_digest(today, depth, sections):
+    return f"""You are working inside the Vauntico codebase. Before you act, always keep this context in mind:
 
 ## 📅 Digest Date
 {today}
 
 ## 📂 Repo Map (Depth: {depth})
-{repo_tree}
+{sections["repo_tree"]}
 
 ## 🎯 Current Mission
-{current_mission}
+{sections["current_mission"]}
 
 ## 🚧 Known Blockers
-{blockers}
+{sections["blockers"]}
 
 ## 🔧 CI/CD Status
-{workflow_failures}
+{sections["workflow_failures"]}
 
 ## 📝 Recent Changes
-{commits}
+{sections["commits"]}
 
 ## 🌐 Deployment Status
-{deployment_status}
+{sections["deployment_status"]}
 
 ## 🔮 Vision Anchor
 Vauntico is building "FICO score for creators" - AI-powered trust infrastructure solving the $104B creator economy's credibility crisis. 
@@ -204,10 +558,236 @@ Target: 2,847+ waitlist users, African market expansion, $1B ARR by Year 5.
 
 When coding, always reason with this context first. Don't treat tasks as isolated snippets — connect them back to the repo's structure, current mission, blockers, and vision. If a request seems incomplete, ask for clarification using this context.
 """
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        f.write(digest)
 
-    print(f"Digest generated at {OUTPUT_FILE} (depth: {depth})")
+def generate_digest(depth, incremental=False, github_ttl=GITHUB_TTL, repo_path=None, output_file=None):
+    """Build one repository's digest, rebuilding only stale sections when incremental.
+
+    Returns the profile report; its `digest_changed` flag tells whether the digest file was rewritten.
+    """
+    paths = digest_paths(repo_path, output_file)
+    repo_path = paths.repo_path
+    if not os.path.isdir(repo_path):
+        raise FileNotFoundError(f"Repository path not found: {repo_path}")
+    # The section cache only exists for incremental runs (including --watch); create it
+    # before walking the tree so the new directory does not invalidate the repo map
+    if incremental:
+        os.makedirs(paths.cache_dir, exist_ok=True)
+    now = time.time()
+    today = datetime.now().strftime("%Y-%m-%d")
+    head = get_git_head(repo_path)
+    tree_inputs = {}
+
+    def build_tree():
+        visited = []
+        tree = get_repo_tree(repo_path, depth, visited=visited, exclude=(paths.output_file, paths.report_file))
+        tree_inputs.update(depth=depth, dirs=visited, mtimes=get_dir_mtimes(visited))
+        return tree
+
+    collectors = {
+        "repo_tree": (build_tree, "(repository tree unavailable)"),
+        "commits": (lambda: get_recent_commits(repo_path=repo_path), "Error fetching commits: timed out"),
+        "blockers": (lambda: get_github_issues(repo_path), "- Unable to fetch GitHub issues (timed out)"),
+        "workflow_failures": (lambda: get_workflow_failures(repo_path), "- Unable to fetch workflow status (timed out)"),
+        "deployment_status": (lambda: get_deployment_status(repo_path), "🔍 UNKNOWN - Unable to determine deployment status"),
+        "current_mission": (lambda: get_dynamic_mission(repo_path), DEFAULT_MISSION),
+    }
+
+    cached = load_section_cache(paths.cache_file).get("sections", {}) if incremental else {}
+    stale = {
+        name: collector for name, collector in collectors.items()
+        if name not in cached or not is_section_fresh(name, cached[name], depth, head, now, github_ttl)
+    }
+
+    # Collect stale sections concurrently; gh queries shared between them run once
+    stats = {name: CollectorStats(status="cached") for name in collectors if name not in stale}
+    results, failed = collect_sections(stale, stats=stats)
+    sections = {name: entry["value"] for name, entry in cached.items() if name not in stale}
+    sections.update(results)
+    for name in collectors:
+        if stats[name].status == "cached":
+            stats[name].output_bytes = len(sections[name].encode("utf-8"))
+
+    digest = render_digest(today, depth, sections)
+    try:
+        with open(paths.output_file, encoding="utf-8", newline="") as f:
+            changed = f.read() != digest
+    except OSError:
+        changed = True
+
+    for name, value in results.items():
+        if name in failed:
+            # Never cache fallbacks; retry them on the next run
+            cached.pop(name, None)
+            continue
+        inputs = {}
+        if name == "repo_tree":
+            inputs = tree_inputs
+        elif name == "commits":
+            inputs = {"head": head}
+        cached[name] = {"value": value, "built_at": now, "inputs": inputs}
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "repo_path": repo_path,
+        "output_file": paths.output_file,
+        "depth": depth,
+        "incremental": incremental,
+        "total_seconds": round(time.time() - now, 4),
+        "digest_bytes": len(digest.encode("utf-8")),
+        "digest_changed": changed,
+        "collectors": {name: stats[name].as_dict() for name in collectors},
+    }
+
+    output_dirs = {os.path.dirname(os.path.abspath(p)) for p in (paths.output_file, paths.report_file)}
+    before = get_dir_mtimes(output_dirs)
+    if changed:
+        write_atomic(paths.output_file, digest)
+    write_atomic(paths.report_file, json.dumps(report, indent=2) + "\n")
+    after = get_dir_mtimes(output_dirs)
+
+    # Our own writes bump the output directory's mtime; don't let them invalidate the tree
+    if before != after:
+        tree_mtimes = cached.get("repo_tree", {}).get("inputs", {}).get("mtimes", {})
+        for p, mtime in before.items():
+            if p in tree_mtimes and tree_mtimes[p] == mtime:
+                tree_mtimes[p] = after[p]
+
+    if incremental:
+        write_atomic(paths.cache_file, json.dumps({"version": CACHE_VERSION, "sections": cached}))
+    return report
+
+def load_batch(batch_file):
+    """Read a batch file: a JSON list of repo paths or {"path", "name", "output", "depth"} objects"""
+    with open(batch_file, encoding="utf-8") as f:
+        entries = json.load(f)
+
+    base = os.path.dirname(os.path.abspath(batch_file))
+    repos = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"path": entry}
+        # Relative paths are resolved against the batch file's directory
+        entry["path"] = os.path.join(base, entry["path"])
+        if entry.get("output"):
+            entry["output"] = os.path.join(base, entry["output"])
+        entry.setdefault("name", os.path.basename(os.path.normpath(entry["path"])))
+        repos.append(entry)
+    return repos
+
+def render_index(reports, index_dir):
+    lines = [
+        "# 📚 Vauntico Digest Index",
+        "",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        "",
+        "| Repository | Digest | Result | Fallbacks | Seconds |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    for name, report in reports:
+        if "error" in report:
+            lines.append(f"| {name} | - | ❌ failed: {report['error']} | - | - |")
+            continue
+        fallbacks = sum(1 for c in report["collectors"].values() if c["status"] not in ("ok", "cached"))
+        result = "updated" if report["digest_changed"] else "up to date"
+        digest = os.path.relpath(report["output_file"], index_dir).replace(os.sep, "/")
+        lines.append(f"| {name} | [{os.path.basename(digest)}]({digest}) | {result} | {fallbacks} | {report['total_seconds']} |")
+    return "\n".join(lines) + "\n"
+
+def run_batch(batch_file, depth, workers=BATCH_WORKERS, incremental=False, github_ttl=GITHUB_TTL, index_file=None):
+    """Build digests for every repository in a batch file on a bounded worker pool, then write a combined index"""
+    repos = load_batch(batch_file)
+    index_file = index_file or os.path.join(os.path.dirname(os.path.abspath(batch_file)), "digest_index.md")
+
+    # gh/git queries stay memoized across the whole batch, so repos share them.
+    # Owners with several repos in the batch get one issue search per label
+    slugs = (get_github_repo(r["path"]) for r in repos if os.path.isdir(r["path"]))
+    owners = [slug.split("/")[0].lower() for slug in slugs if slug]
+    _shared_orgs.update(owner for owner in set(owners) if owners.count(owner) > 1)
+    try:
+        reports = _build_batch(repos, depth, workers, incremental, github_ttl)
+    finally:
+        _shared_orgs.clear()
+
+    write_atomic(index_file, render_index(reports, os.path.dirname(os.path.abspath(index_file))))
+    print(f"Digest index written to {index_file} ({len(reports)} repositories)")
+    return reports
+
+def _build_batch(repos, depth, workers, incremental, github_ttl):
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            (repo["name"], pool.submit(generate_digest, repo.get("depth", depth), incremental, github_ttl, repo["path"], repo.get("output")))
+            for repo in repos
+        ]
+        reports = []
+        for name, future in futures:
+            try:
+                report = future.result()
+                state = "generated" if report["digest_changed"] else "up to date"
+                print(f"[{name}] Digest {state} at {report['output_file']}")
+            except Exception as e:
+                print(f"[{name}] Digest generation failed: {e}")
+                report = {"error": str(e)}
+            reports.append((name, report))
+    return reports
+
+def watch(depth, interval, github_ttl=GITHUB_TTL):
+    """Regenerate the digest whenever its inputs change, polling every `interval` seconds"""
+    print(f"Watching {REPO_PATH} every {interval}s (Ctrl+C to stop)")
+    try:
+        while True:
+            reset_queries()
+            if generate_digest(depth, incremental=True, github_ttl=github_ttl)["digest_changed"]:
+                print(f"Digest generated at {OUTPUT_FILE} (depth: {depth})")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the Vauntico daily digest")
+    parser.add_argument("depth", nargs="?", help="repository tree depth (default: 2)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse cached sections whose inputs have not changed")
+    parser.add_argument("--watch", type=float, nargs="?", const=30.0, metavar="SECONDS",
+                        help="keep running and regenerate when inputs change (default poll: 30s)")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="JSON list of repositories to build digests for concurrently")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS, metavar="N",
+                        help=f"repositories built at once in --batch mode (default: {BATCH_WORKERS})")
+    parser.add_argument("--index", metavar="FILE",
+                        help="combined index written by --batch (default: digest_index.md next to the batch file)")
+    parser.add_argument("--github-ttl", type=float, default=GITHUB_TTL, metavar="SECONDS",
+                        help=f"how long cached GitHub sections stay fresh (default: {GITHUB_TTL}s)")
+    args = parser.parse_args()
+    if args.batch and args.watch is not None:
+        parser.error("--watch cannot be combined with --batch")
+
+    # Parse command line arguments for depth
+    depth = 2  # default
+    if args.depth is not None:
+        try:
+            depth = int(args.depth)
+        except ValueError:
+            print(f"Invalid depth argument: {args.depth}. Using default depth of 2.")
+    
+    # Also check for environment variable (for GitHub Actions)
+    if 'DEPTH' in os.environ:
+        try:
+            depth = int(os.environ['DEPTH'])
+        except ValueError:
+            pass
+    
+    if args.batch:
+        run_batch(args.batch, depth, args.workers, args.incremental, args.github_ttl, args.index)
+        return
+
+    if args.watch is not None:
+        watch(depth, args.watch, args.github_ttl)
+        return
+
+    if generate_digest(depth, incremental=args.incremental, github_ttl=args.github_ttl)["digest_changed"]:
+        print(f"Digest generated at {OUTPUT_FILE} (depth: {depth})")
+    else:
+        print(f"Digest at {OUTPUT_FILE} is up to date (depth: {depth})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,6 +4,16 @@ Official Python client SDK for the Vauntico Trust Score Dashboard API
 """
 
 from .client import VaunticoApiClient, create_api_client
+from .auth import (
+    TokenProvider,
+    StaticTokenProvider,
+    RefreshingTokenProvider,
+    get_token_expiry,
+)
+from .transports import RecordingTransport, ReplayTransport, ReplayMissError
+from .compact import CompactTrustScore, CompactUser, CompactTrendSeries
+from .compression import CompressionStats
+from .cache import TrustScoreCache
 from .types import (
     SubscriptionTier,
     FeatureStatus,
@@ -43,6 +53,27 @@ __all__ = [
     "VaunticoApiClient",
     "create_api_client",
     
+    # Authentication
+    "TokenProvider",
+    "StaticTokenProvider",
+    "RefreshingTokenProvider",
+    "get_token_expiry",
+    
+    # Transports
+    "RecordingTransport",
+    "ReplayTransport",
+    
+    # Caching
+    "TrustScoreCache",
+    
+    # Compact records
+    "CompactTrustScore",
+    "CompactUser",
+    "CompactTrendSeries",
+    
+    # Metrics
+    "CompressionStats",
+    
     # Enums
     "SubscriptionTier",
     "FeatureStatus", 
@@ -75,4 +106,5 @@ __all__ = [
     # Exceptions
     "VaunticoApiError",
     "RateLimitError",
+    "ReplayMissError",
 ]
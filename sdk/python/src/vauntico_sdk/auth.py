@@ -0,0 +1,151 @@
+"""
+Access token providers for the Vauntico API Client
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+import jwt
+
+
+def get_token_expiry(token: str) -> Optional[float]:
+    """Read the `exp` claim of a JWT without verifying its signature"""
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return None
+
+    exp = claims.get("exp")
+    if exp is None:
+        return None
+    try:
+        return float(exp)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenProvider:
+    """Interface for supplying bearer tokens to the client"""
+
+    async def get_token(self) -> str:
+        """Return a token that is valid for the next request"""
+        raise NotImplementedError
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """Mark a token as rejected by the API"""
+
+    async def close(self) -> None:
+        """Release any background work held by the provider"""
+
+
+class StaticTokenProvider(TokenProvider):
+    """Provider that always returns the same token"""
+
+    def __init__(self, token: str):
+        self.token = token
+
+    async def get_token(self) -> str:
+        return self.token
+
+
+class RefreshingTokenProvider(TokenProvider):
+    """
+    Provider that refreshes a JWT ahead of its expiry.
+
+    Once the current token is within `refresh_margin` seconds of its `exp`
+    claim, callers keep receiving it while a single refresh runs in the
+    background. When the token has already expired (or was invalidated),
+    concurrent callers all await that same refresh instead of each
+    starting their own.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], Awaitable[str]],
+        token: Optional[str] = None,
+        refresh_margin: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._refresh = refresh
+        self.refresh_margin = refresh_margin
+        self._clock = clock
+        self._token: Optional[str] = None
+        self._expires_at: Optional[float] = None
+        self._refresh_task: Optional["asyncio.Future[str]"] = None
+
+        if token:
+            self._set_token(token)
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        return self._expires_at
+
+    def _set_token(self, token: str) -> None:
+        self._token = token
+        self._expires_at = get_token_expiry(token)
+
+    def _is_expired(self) -> bool:
+        if self._token is None:
+            return True
+        if self._expires_at is None:
+            return False
+        return self._clock() >= self._expires_at
+
+    def _needs_refresh(self) -> bool:
+        if self._expires_at is None:
+            return False
+        return self._clock() >= self._expires_at - self.refresh_margin
+
+    async def _run_refresh(self) -> str:
+        try:
+            token = await self._refresh()
+            self._set_token(token)
+            return token
+        finally:
+            self._refresh_task = None
+
+    def _start_refresh(self) -> "asyncio.Future[str]":
+        if self._refresh_task is None:
+            task = asyncio.ensure_future(self._run_refresh())
+            # A failed background refresh is retried on the next call
+            task.add_done_callback(
+                lambda t: t.exception() if not t.cancelled() else None
+            )
+            self._refresh_task = task
+        return self._refresh_task
+
+    async def refresh(self) -> str:
+        """Refresh the token now, joining any refresh already in flight"""
+        return await asyncio.shield(self._start_refresh())
+
+    async def get_token(self) -> str:
+        if self._is_expired():
+            return await self.refresh()
+
+        if self._needs_refresh():
+            self._start_refresh()
+
+        assert self._token is not None
+        return self._token
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        # Ignore rejections of a token that has already been replaced
+        if token is not None and token != self._token:
+            return
+        self._token = None
+        self._expires_at = None
+
+    async def close(self) -> None:
+        task = self._refresh_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._refresh_task = None
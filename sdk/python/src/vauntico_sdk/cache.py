@@ -0,0 +1,126 @@
+"""
+Client-side trust score cache with stale-while-revalidate refresh
+"""
+
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from .compact import CompactTrustScore
+from .types import TrustScoreResponse
+
+Loader = Callable[[], Awaitable[TrustScoreResponse]]
+
+
+class _CacheEntry:
+    __slots__ = ("record", "refresh_at")
+
+    def __init__(self, record: CompactTrustScore, refresh_at: float):
+        self.record = record
+        self.refresh_at = refresh_at
+
+
+class TrustScoreCache:
+    """
+    Cache of trust scores keyed by request, honouring each score's `expires_at`.
+
+    Reads that land within `refresh_ahead` seconds of expiry return the cached
+    score immediately and start one background refresh for that key. Each
+    entry's refresh point is pulled earlier by a random fraction (`jitter`) of
+    the window so that keys cached together do not all refresh at once. Reads
+    after expiry wait for a single shared reload. Entries are held as
+    `CompactTrustScore` records and evicted least-recently-used beyond
+    `max_entries`.
+    """
+
+    def __init__(
+        self,
+        refresh_ahead: float = 30.0,
+        jitter: float = 0.5,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.refresh_ahead = refresh_ahead
+        self.jitter = jitter
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, "asyncio.Future[TrustScoreResponse]"] = {}
+        self._background: Set["asyncio.Future[TrustScoreResponse]"] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _refresh_point(self, expires_at: float) -> float:
+        window = self.refresh_ahead * (1 + random.uniform(0, self.jitter))
+        return expires_at - window
+
+    def _store(self, key: Hashable, score: TrustScoreResponse) -> None:
+        record = CompactTrustScore.from_model(score)
+        self._entries[key] = _CacheEntry(record, self._refresh_point(record.expires_at))
+        self._entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def _run_load(self, key: Hashable, loader: Loader) -> TrustScoreResponse:
+        try:
+            score = await loader()
+            self._store(key, score)
+            return score
+        finally:
+            self._inflight.pop(key, None)
+
+    def _start_load(
+        self, key: Hashable, loader: Loader
+    ) -> "asyncio.Future[TrustScoreResponse]":
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_load(key, loader))
+            self._inflight[key] = task
+        return task
+
+    def _refresh_in_background(self, key: Hashable, loader: Loader) -> None:
+        if key in self._inflight:
+            return
+        task = self._start_load(key, loader)
+        self._background.add(task)
+
+        def _done(t: "asyncio.Future[TrustScoreResponse]") -> None:
+            self._background.discard(t)
+            # A failed refresh keeps serving the cached score until it expires
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(_done)
+
+    async def get(self, key: Hashable, loader: Loader) -> TrustScoreResponse:
+        """Return the cached score for `key`, loading it with `loader` as needed"""
+        entry = self._entries.get(key)
+        now = self._clock()
+
+        if entry is None or now >= entry.record.expires_at:
+            return await asyncio.shield(self._start_load(key, loader))
+
+        self._entries.move_to_end(key)
+        if now >= entry.refresh_at:
+            self._refresh_in_background(key, loader)
+        return entry.record.to_model()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached score for `key`"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def close(self) -> None:
+        """Cancel background refreshes that are still running"""
+        tasks = list(self._background)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._background.clear()
@@ -5,6 +5,10 @@ Vauntico API Client for Python
 import asyncio
 from typing import Optional, Dict, Any, Union
 import httpx
+from .auth import TokenProvider
+from .cache import TrustScoreCache
+from .compression import BROTLI_AVAILABLE, CompressionStats, compress_json_body
+from .transports import ReplayMissError
 from .types import (
     VaunticoApiError,
     RateLimitError,
@@ -33,17 +37,26 @@ class VaunticoApiClient:
         access_token: Optional[str] = None,
         timeout: float = 30.0,
         retries: int = 3,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        token_provider: Optional[TokenProvider] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        compression_threshold: Optional[int] = None,
+        trust_score_cache: Optional[TrustScoreCache] = None
     ):
         self.base_url = base_url
         self.api_key = api_key
         self.access_token = access_token
         self.timeout = timeout
         self.retries = retries
+        self.token_provider = token_provider
+        self.compression_threshold = compression_threshold
+        self.compression_stats = CompressionStats()
+        self.trust_score_cache = trust_score_cache
         
         # Setup HTTP client
         self.client = httpx.AsyncClient(
             timeout=timeout,
+            transport=transport,
             headers={
                 "Content-Type": "application/json",
                 "User-Agent": "vauntico-sdk-python/1.0.0",
@@ -51,6 +64,18 @@ class VaunticoApiClient:
             }
         )
         
+        # httpx advertises the encodings it can decode; only add brotli if it is
+        # installed but missing there and the caller did not pick an encoding
+        accept_encoding = self.client.headers.get("Accept-Encoding", "")
+        if (
+            BROTLI_AVAILABLE
+            and "br" not in accept_encoding
+            and not any(name.lower() == "accept-encoding" for name in headers or {})
+        ):
+            self.client.headers["Accept-Encoding"] = ", ".join(
+                filter(None, ["br", accept_encoding])
+            )
+        
         # Add authentication headers
         if api_key:
             self.client.headers["X-API-Key"] = api_key
@@ -83,6 +108,38 @@ class VaunticoApiClient:
                 correlation_id=response.headers.get("x-correlation-id")
             )
 
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> httpx.Response:
+        """Send a request, attaching a bearer token from the token provider"""
+        if self.token_provider is None or self.api_key:
+            return await self.client.request(method, url, **kwargs)
+
+        extra_headers = kwargs.pop("headers", None) or {}
+        token = await self.token_provider.get_token()
+        response = await self.client.request(
+            method,
+            url,
+            headers={**extra_headers, "Authorization": f"Bearer {token}"},
+            **kwargs
+        )
+
+        if response.status_code == 401:
+            # Token was revoked early; refresh once and replay the request
+            self.token_provider.invalidate(token)
+            token = await self.token_provider.get_token()
+            response = await self.client.request(
+                method,
+                url,
+                headers={**extra_headers, "Authorization": f"Bearer {token}"},
+                **kwargs
+            )
+
+        return response
+
     async def _make_request(
         self,
         method: str,
@@ -92,9 +149,20 @@ class VaunticoApiClient:
         """Make HTTP request with error handling"""
         url = f"{self.base_url}{endpoint}"
         
+        # Gzip large JSON bodies once so retries resend the same payload
+        if self.compression_threshold is not None and "json" in kwargs:
+            body, body_headers, raw_size = compress_json_body(
+                kwargs.pop("json"),
+                self.compression_threshold
+            )
+            kwargs["content"] = body
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **body_headers}
+            self.compression_stats.record_request(raw_size, len(body))
+        
         for attempt in range(self.retries):
             try:
-                response = await self.client.request(method, url, **kwargs)
+                response = await self._send(method, url, **kwargs)
+                self.compression_stats.record_response(response)
                 
                 # Check for error status codes
                 if response.status_code >= 400:
@@ -118,6 +186,10 @@ class VaunticoApiClient:
                     )
                 await asyncio.sleep(2 ** attempt)
                 
+            except ReplayMissError:
+                # Surface cassette misses as-is so tests can tell them from API errors
+                raise
+                
             except Exception as e:
                 raise VaunticoApiError(
                     response={"error": f"Unknown error: {str(e)}"},
@@ -131,6 +203,21 @@ class VaunticoApiClient:
         cache: bool = True
     ) -> TrustScoreResponse:
         """Get user trust score"""
+        if cache and self.trust_score_cache is not None:
+            return await self.trust_score_cache.get(
+                (user_id, include_factors),
+                lambda: self._fetch_trust_score(user_id, include_factors, cache)
+            )
+        
+        return await self._fetch_trust_score(user_id, include_factors, cache)
+
+    async def _fetch_trust_score(
+        self,
+        user_id: str,
+        include_factors: bool,
+        cache: bool
+    ) -> TrustScoreResponse:
+        """Fetch user trust score from the API"""
         response_data = await self._make_request(
             "GET",
             "/dashboard/trustscore",
@@ -242,7 +329,9 @@ class VaunticoApiClient:
         api_key: Optional[str] = None,
         access_token: Optional[str] = None,
         timeout: Optional[float] = None,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        token_provider: Optional[TokenProvider] = None,
+        compression_threshold: Optional[int] = None
     ) -> None:
         """Update client configuration"""
         if base_url is not None:
@@ -267,6 +356,12 @@ class VaunticoApiClient:
         if headers is not None:
             self.client.headers.update(headers)
 
+        if token_provider is not None:
+            self.token_provider = token_provider
+
+        if compression_threshold is not None:
+            self.compression_threshold = compression_threshold
+
     def get_config(self) -> Dict[str, Any]:
         """Get current configuration"""
         return {
@@ -275,10 +370,16 @@ class VaunticoApiClient:
             "access_token": self.access_token,
             "timeout": self.timeout,
             "retries": self.retries,
+            "token_provider": self.token_provider,
+            "compression_threshold": self.compression_threshold,
         }
 
     async def close(self) -> None:
         """Close the HTTP client"""
+        if self.trust_score_cache is not None:
+            await self.trust_score_cache.close()
+        if self.token_provider is not None:
+            await self.token_provider.close()
         await self.client.aclose()
 
 
@@ -289,7 +390,11 @@ def create_api_client(
     access_token: Optional[str] = None,
     timeout: float = 30.0,
     retries: int = 3,
-    headers: Optional[Dict[str, str]] = None
+    headers: Optional[Dict[str, str]] = None,
+    token_provider: Optional[TokenProvider] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    compression_threshold: Optional[int] = None,
+    trust_score_cache: Optional[TrustScoreCache] = None
 ) -> VaunticoApiClient:
     """Create a new Vauntico API client instance"""
     return VaunticoApiClient(
@@ -298,5 +403,9 @@ def create_api_client(
         access_token=access_token,
         timeout=timeout,
         retries=retries,
-        headers=headers
+        headers=headers,
+        token_provider=token_provider,
+        transport=transport,
+        compression_threshold=compression_threshold,
+        trust_score_cache=trust_score_cache
     )
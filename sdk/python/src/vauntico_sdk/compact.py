@@ -0,0 +1,274 @@
+"""
+Compact, slots-based records for caching large numbers of API models
+"""
+
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, overload
+
+from .types import (
+    SubscriptionInfo,
+    SubscriptionTier,
+    TrendDataPoint,
+    TrendDirection,
+    TrustScoreFactors,
+    TrustScoreResponse,
+    User,
+)
+
+# Enum members are stored as small integer codes into these tables
+_TIERS: Tuple[SubscriptionTier, ...] = tuple(SubscriptionTier)
+_TIER_CODES = {tier: code for code, tier in enumerate(_TIERS)}
+_TRENDS: Tuple[TrendDirection, ...] = tuple(TrendDirection)
+_TREND_CODES = {trend: code for code, trend in enumerate(_TRENDS)}
+
+
+def _to_timestamp(value: datetime) -> float:
+    # Naive datetimes are taken to be UTC so that round trips are stable
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _from_timestamp(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+class CompactTrustScore:
+    """
+    Compact form of `TrustScoreResponse`.
+
+    Factors are flattened into the record, enums are stored as integer codes
+    and datetimes as UTC timestamps. Use `to_model()` to get the public model
+    back; datetimes come back as timezone-aware UTC values.
+    """
+
+    __slots__ = (
+        "score",
+        "tier_code",
+        "engagement",
+        "consistency",
+        "quality",
+        "community",
+        "calculated_at",
+        "expires_at",
+        "trend_code",
+        "change",
+        "last_updated",
+    )
+
+    def __init__(
+        self,
+        score: float,
+        tier_code: int,
+        engagement: float,
+        consistency: float,
+        quality: float,
+        community: float,
+        calculated_at: float,
+        expires_at: float,
+        trend_code: int,
+        change: float,
+        last_updated: float,
+    ):
+        self.score = score
+        self.tier_code = tier_code
+        self.engagement = engagement
+        self.consistency = consistency
+        self.quality = quality
+        self.community = community
+        self.calculated_at = calculated_at
+        self.expires_at = expires_at
+        self.trend_code = trend_code
+        self.change = change
+        self.last_updated = last_updated
+
+    @classmethod
+    def from_model(cls, model: TrustScoreResponse) -> "CompactTrustScore":
+        factors = model.factors
+        return cls(
+            score=model.score,
+            tier_code=_TIER_CODES[model.tier],
+            engagement=factors.engagement,
+            consistency=factors.consistency,
+            quality=factors.quality,
+            community=factors.community,
+            calculated_at=_to_timestamp(model.calculated_at),
+            expires_at=_to_timestamp(model.expires_at),
+            trend_code=_TREND_CODES[model.trend],
+            change=model.change,
+            last_updated=_to_timestamp(model.last_updated),
+        )
+
+    @property
+    def tier(self) -> SubscriptionTier:
+        return _TIERS[self.tier_code]
+
+    @property
+    def trend(self) -> TrendDirection:
+        return _TRENDS[self.trend_code]
+
+    def to_model(self) -> TrustScoreResponse:
+        return TrustScoreResponse.model_construct(
+            score=self.score,
+            tier=self.tier,
+            factors=TrustScoreFactors.model_construct(
+                engagement=self.engagement,
+                consistency=self.consistency,
+                quality=self.quality,
+                community=self.community,
+            ),
+            calculated_at=_from_timestamp(self.calculated_at),
+            expires_at=_from_timestamp(self.expires_at),
+            trend=self.trend,
+            change=self.change,
+            last_updated=_from_timestamp(self.last_updated),
+        )
+
+
+class CompactUser:
+    """
+    Compact form of `User`.
+
+    The tier is stored as an integer code and datetimes as UTC timestamps.
+    String fields are unique per user and kept as-is rather than interned.
+    The rarely populated `subscription` is kept as its model instance.
+    """
+
+    __slots__ = (
+        "id",
+        "email",
+        "username",
+        "display_name",
+        "avatar",
+        "tier_code",
+        "subscription",
+        "created_at",
+        "last_login",
+        "verified",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        email: str,
+        username: str,
+        display_name: Optional[str],
+        avatar: Optional[str],
+        tier_code: int,
+        subscription: Optional[SubscriptionInfo],
+        created_at: float,
+        last_login: Optional[float],
+        verified: bool,
+    ):
+        self.id = id
+        self.email = email
+        self.username = username
+        self.display_name = display_name
+        self.avatar = avatar
+        self.tier_code = tier_code
+        self.subscription = subscription
+        self.created_at = created_at
+        self.last_login = last_login
+        self.verified = verified
+
+    @classmethod
+    def from_model(cls, model: User) -> "CompactUser":
+        return cls(
+            id=model.id,
+            email=model.email,
+            username=model.username,
+            display_name=model.display_name,
+            avatar=model.avatar,
+            tier_code=_TIER_CODES[model.tier],
+            subscription=model.subscription,
+            created_at=_to_timestamp(model.created_at),
+            last_login=(
+                _to_timestamp(model.last_login)
+                if model.last_login is not None
+                else None
+            ),
+            verified=model.verified,
+        )
+
+    @property
+    def tier(self) -> SubscriptionTier:
+        return _TIERS[self.tier_code]
+
+    def to_model(self) -> User:
+        return User.model_construct(
+            id=self.id,
+            email=self.email,
+            username=self.username,
+            display_name=self.display_name,
+            avatar=self.avatar,
+            tier=self.tier,
+            subscription=self.subscription,
+            created_at=_from_timestamp(self.created_at),
+            last_login=(
+                _from_timestamp(self.last_login)
+                if self.last_login is not None
+                else None
+            ),
+            verified=self.verified,
+        )
+
+
+class CompactTrendSeries(Sequence[TrendDataPoint]):
+    """
+    Array-backed sequence of `TrendDataPoint` values.
+
+    Scores and benchmarks live in `array('d')` buffers and dates are interned,
+    so a series costs a few bytes per point instead of a model instance each.
+    Indexing materialises `TrendDataPoint` models on demand.
+    """
+
+    __slots__ = ("dates", "scores", "benchmarks")
+
+    def __init__(self, points: Iterable[TrendDataPoint] = ()):
+        self.dates: List[str] = []
+        self.scores = array("d")
+        self.benchmarks = array("d")
+        self.extend(points)
+
+    def append(self, point: TrendDataPoint) -> None:
+        self.dates.append(sys.intern(point.date))
+        self.scores.append(point.score)
+        self.benchmarks.append(point.benchmark)
+
+    def extend(self, points: Iterable[TrendDataPoint]) -> None:
+        for point in points:
+            self.append(point)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def _point(self, index: int) -> TrendDataPoint:
+        return TrendDataPoint.model_construct(
+            date=self.dates[index],
+            score=self.scores[index],
+            benchmark=self.benchmarks[index],
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> TrendDataPoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[TrendDataPoint]: ...
+
+    def __getitem__(self, index):  # type: ignore[no-untyped-def]
+        if isinstance(index, slice):
+            return [self._point(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("trend series index out of range")
+        return self._point(index)
+
+    def __iter__(self) -> Iterator[TrendDataPoint]:
+        for index in range(len(self)):
+            yield self._point(index)
+
+    def to_models(self) -> List[TrendDataPoint]:
+        return list(self)
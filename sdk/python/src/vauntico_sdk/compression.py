@@ -0,0 +1,102 @@
+"""
+Payload compression helpers and transfer size metrics
+"""
+
+import gzip
+import json
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+try:  # Brotli decoding is optional; httpx picks up either package
+    import brotli  # noqa: F401
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+
+def compress_json_body(
+    payload: Any,
+    threshold: int,
+    level: int = 6,
+) -> Tuple[bytes, Dict[str, str], int]:
+    """
+    Serialize a JSON payload, gzip-compressing it when it is at least
+    `threshold` bytes and compression makes it smaller. Returns the body, the
+    headers to send with it and the uncompressed size.
+    """
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if len(raw) < threshold:
+        return raw, headers, len(raw)
+
+    # A fixed mtime keeps the bytes identical for identical payloads, so retries,
+    # caches and replay cassettes see the same body
+    body = gzip.compress(raw, compresslevel=level, mtime=0)
+    if len(body) >= len(raw):
+        return raw, headers, len(raw)
+
+    headers["Content-Encoding"] = "gzip"
+    return body, headers, len(raw)
+
+
+class CompressionStats:
+    """Running totals of bytes sent and received, before and after encoding"""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests_compressed = 0
+        self.request_bytes_raw = 0
+        self.request_bytes_sent = 0
+        self.responses = 0
+        self.response_bytes_wire = 0
+        self.response_bytes_decoded = 0
+        self.response_encodings: Dict[str, int] = {}
+
+    def record_request(self, raw_size: int, sent_size: int) -> None:
+        if sent_size < raw_size:
+            self.requests_compressed += 1
+        self.request_bytes_raw += raw_size
+        self.request_bytes_sent += sent_size
+
+    def record_response(self, response: httpx.Response) -> None:
+        decoded = len(response.content)
+        # Responses built in memory (e.g. by replay transports) report 0 here
+        wire = response.num_bytes_downloaded or decoded
+        encoding = response.headers.get("content-encoding", "identity").lower()
+
+        self.responses += 1
+        self.response_bytes_wire += wire
+        self.response_bytes_decoded += decoded
+        self.response_encodings[encoding] = (
+            self.response_encodings.get(encoding, 0) + 1
+        )
+
+    @staticmethod
+    def _ratio(compressed: int, raw: int) -> Optional[float]:
+        return compressed / raw if raw else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests_compressed": self.requests_compressed,
+            "request_bytes_raw": self.request_bytes_raw,
+            "request_bytes_sent": self.request_bytes_sent,
+            "request_ratio": self._ratio(
+                self.request_bytes_sent, self.request_bytes_raw
+            ),
+            "responses": self.responses,
+            "response_bytes_wire": self.response_bytes_wire,
+            "response_bytes_decoded": self.response_bytes_decoded,
+            "response_ratio": self._ratio(
+                self.response_bytes_wire, self.response_bytes_decoded
+            ),
+            "response_encodings": dict(self.response_encodings),
+        }
@@ -0,0 +1,181 @@
+"""
+Record/replay HTTP transports for offline testing of the Vauntico API Client
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, IO, List, Optional, Tuple
+
+import httpx
+
+CASSETTE_VERSION = 1
+
+# Headers that describe the wire encoding rather than the decoded body we store
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+RequestKey = Tuple[str, str, str]
+
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed request has no recorded response"""
+
+
+def _open_cassette(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+def _body_digest(body: bytes) -> str:
+    return hashlib.sha1(body).hexdigest() if body else ""
+
+
+def _encode_body(content: bytes) -> Dict[str, str]:
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(entry: Dict[str, Any]) -> bytes:
+    if "body_b64" in entry:
+        return base64.b64decode(entry["body_b64"])
+    return entry.get("body", "").encode("utf-8")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that forwards requests to a real transport and records every
+    request/response pair, with its latency, to a JSON Lines cassette.
+    Cassettes whose path ends in `.gz` are gzip-compressed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.path = path
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.entries: List[Dict[str, Any]] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        sent = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.monotonic() - sent
+
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        self.entries.append({
+            "method": request.method,
+            "url": str(request.url),
+            "body_sha1": _body_digest(body),
+            "elapsed": round(elapsed, 6),
+            "status": response.status_code,
+            "headers": headers,
+            **_encode_body(content),
+        })
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+        )
+
+    def save(self) -> None:
+        """Write the recorded entries to the cassette file"""
+        with _open_cassette(self.path, "w") as f:
+            f.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+            for entry in self.entries:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    async def aclose(self) -> None:
+        self.save()
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that serves responses from a cassette written by
+    `RecordingTransport` without touching the network.
+
+    Each response is delayed by its recorded latency divided by `speed`
+    (`speed=0` disables delays). Repeated requests are served in recording
+    order and wrap around once exhausted. `max_concurrency` caps the number
+    of responses in flight to mimic a backend's capacity. Requests with no
+    recording raise `ReplayMissError`, which the client lets propagate.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        speed: float = 1.0,
+        max_concurrency: Optional[int] = None,
+    ):
+        self.path = path
+        self.speed = speed
+        self.max_concurrency = max_concurrency
+        # Created on first use so it binds to the loop that serves requests
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._recorded: Dict[RequestKey, List[Dict[str, Any]]] = defaultdict(list)
+        self._pending: Dict[RequestKey, Deque[Dict[str, Any]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        with _open_cassette(self.path, "r") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(
+                    f"Unsupported cassette version: {header.get('version')}"
+                )
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = (entry["method"].upper(), entry["url"], entry["body_sha1"])
+                self._recorded[key].append(entry)
+
+    def _next_entry(self, key: RequestKey) -> Dict[str, Any]:
+        recorded = self._recorded.get(key)
+        if not recorded:
+            raise ReplayMissError(f"No recorded response for {key[0]} {key[1]}")
+        pending = self._pending.get(key)
+        if not pending:
+            pending = self._pending[key] = deque(recorded)
+        return pending.popleft()
+
+    async def _respond(self, request: httpx.Request, entry: Dict[str, Any]) -> httpx.Response:
+        if self.speed > 0 and entry.get("elapsed"):
+            await asyncio.sleep(entry["elapsed"] / self.speed)
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=[tuple(header) for header in entry.get("headers", [])],
+            content=_decode_body(entry),
+            request=request,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        key = (request.method.upper(), str(request.url), _body_digest(body))
+        entry = self._next_entry(key)
+
+        if not self.max_concurrency:
+            return await self._respond(request, entry)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await self._respond(request, entry)
@@ -0,0 +1,130 @@
+"""
+Tests for access token providers and bearer token handling in the client
+"""
+
+import asyncio
+import time
+
+import httpx
+import jwt
+import pytest
+
+from vauntico_sdk import RefreshingTokenProvider, VaunticoApiClient, get_token_expiry
+
+SECRET = "test-secret-key-that-is-long-enough-for-hs256"
+
+HEALTH_BODY = {
+    "data": {
+        "status": "healthy",
+        "timestamp": "2026-01-01T00:00:00Z",
+        "services": {},
+    }
+}
+
+
+def make_token(expires_in: float, **claims) -> str:
+    return jwt.encode(
+        {"exp": int(time.time() + expires_in), **claims}, SECRET, algorithm="HS256"
+    )
+
+
+class Refresher:
+    """Refresh callable that counts calls and hands out numbered tokens"""
+
+    def __init__(self, delay: float = 0.01, fail: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("refresh failed")
+        return make_token(3600, n=self.calls)
+
+
+def test_get_token_expiry_reads_exp_claim():
+    token = make_token(60)
+    assert get_token_expiry(token) == jwt.decode(token, SECRET, algorithms=["HS256"])["exp"]
+    assert get_token_expiry("not-a-jwt") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_on_expired_token_share_one_refresh():
+    refresher = Refresher(delay=0.05)
+    provider = RefreshingTokenProvider(refresher, token=make_token(-10))
+
+    tokens = await asyncio.gather(*[provider.get_token() for _ in range(20)])
+
+    assert refresher.calls == 1
+    assert len(set(tokens)) == 1
+    assert get_token_expiry(tokens[0]) > time.time()
+
+
+@pytest.mark.asyncio
+async def test_token_near_expiry_is_served_while_refreshing_in_background():
+    refresher = Refresher()
+    current = make_token(30)
+    provider = RefreshingTokenProvider(refresher, token=current, refresh_margin=60)
+
+    assert await provider.get_token() == current
+    assert await provider.get_token() == current
+    await asyncio.sleep(0.05)
+
+    assert refresher.calls == 1
+    assert await provider.get_token() != current
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_current_token():
+    refresher = Refresher(fail=True)
+    current = make_token(30)
+    provider = RefreshingTokenProvider(refresher, token=current, refresh_margin=60)
+
+    assert await provider.get_token() == current
+    await asyncio.sleep(0.05)
+
+    assert await provider.get_token() == current
+    await provider.close()
+
+
+def test_invalidate_ignores_token_that_was_already_replaced():
+    current = make_token(3600)
+    provider = RefreshingTokenProvider(Refresher(), token=current)
+
+    provider.invalidate("some-older-token")
+    assert provider.token == current
+
+    provider.invalidate(current)
+    assert provider.token is None
+
+
+@pytest.mark.asyncio
+async def test_client_replays_once_after_401_with_refreshed_token():
+    refresher = Refresher()
+    revoked = make_token(3600, n=0)
+    provider = RefreshingTokenProvider(refresher, token=revoked)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        auth = request.headers["authorization"]
+        seen.append(auth)
+        if auth == f"Bearer {revoked}":
+            return httpx.Response(401, json={"error": "token revoked"})
+        return httpx.Response(200, json=HEALTH_BODY)
+
+    client = VaunticoApiClient(
+        base_url="http://api.test",
+        token_provider=provider,
+        transport=httpx.MockTransport(handler),
+    )
+    health = await client.health_check()
+    await client.close()
+
+    assert health.status == "healthy"
+    assert refresher.calls == 1
+    assert len(seen) == 2
+    assert seen[0] == f"Bearer {revoked}"
+    assert seen[1] == f"Bearer {provider.token}"
@@ -0,0 +1,140 @@
+"""
+Tests for the stale-while-revalidate trust score cache
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from vauntico_sdk import TrustScoreCache, TrustScoreResponse
+
+NOW = 1_800_000_000.0
+
+
+class Clock:
+    def __init__(self, now: float = NOW):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_score(score: float, expires_at: float) -> TrustScoreResponse:
+    stamp = datetime.fromtimestamp(NOW, tz=timezone.utc).isoformat()
+    return TrustScoreResponse(
+        score=score,
+        tier="gold",
+        factors={"engagement": 1, "consistency": 2, "quality": 3, "community": 4},
+        calculatedAt=stamp,
+        expiresAt=datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat(),
+        trend="up",
+        change=0.5,
+        lastUpdated=stamp,
+    )
+
+
+class Loader:
+    """Loader that counts calls and returns increasing scores expiring in `ttl` seconds"""
+
+    def __init__(self, clock: Clock, ttl: float = 300, delay: float = 0.01):
+        self.clock = clock
+        self.ttl = ttl
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    async def __call__(self) -> TrustScoreResponse:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream unavailable")
+        return make_score(float(self.calls), self.clock.now + self.ttl)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    clock = Clock()
+    loader = Loader(clock)
+    cache = TrustScoreCache(clock=clock)
+
+    scores = await asyncio.gather(*[cache.get("user-1", loader) for _ in range(10)])
+
+    assert loader.calls == 1
+    assert {s.score for s in scores} == {1.0}
+
+
+@pytest.mark.asyncio
+async def test_read_in_refresh_window_serves_stale_and_refreshes_once():
+    clock = Clock()
+    loader = Loader(clock)
+    cache = TrustScoreCache(refresh_ahead=30, jitter=0, clock=clock)
+    await cache.get("user-1", loader)
+
+    # 10 seconds before expiry, inside the 30 second refresh window
+    clock.now = NOW + 290
+    scores = await asyncio.gather(*[cache.get("user-1", loader) for _ in range(5)])
+
+    assert {s.score for s in scores} == {1.0}
+    assert loader.calls == 2
+    await asyncio.sleep(0.05)
+    assert (await cache.get("user-1", loader)).score == 2.0
+    assert loader.calls == 2
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_read_outside_refresh_window_does_not_load():
+    clock = Clock()
+    loader = Loader(clock)
+    cache = TrustScoreCache(refresh_ahead=30, jitter=0, clock=clock)
+    await cache.get("user-1", loader)
+
+    clock.now = NOW + 100
+    assert (await cache.get("user-1", loader)).score == 1.0
+    await asyncio.sleep(0.02)
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_cached_score():
+    clock = Clock()
+    loader = Loader(clock)
+    cache = TrustScoreCache(refresh_ahead=30, jitter=0, clock=clock)
+    await cache.get("user-1", loader)
+
+    loader.fail = True
+    clock.now = NOW + 290
+    assert (await cache.get("user-1", loader)).score == 1.0
+    await asyncio.sleep(0.05)
+
+    assert loader.calls == 2
+    assert (await cache.get("user-1", loader)).score == 1.0
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_waits_for_reload():
+    clock = Clock()
+    loader = Loader(clock)
+    cache = TrustScoreCache(refresh_ahead=30, jitter=0, clock=clock)
+    await cache.get("user-1", loader)
+
+    clock.now = NOW + 301
+    assert (await cache.get("user-1", loader)).score == 2.0
+
+
+@pytest.mark.asyncio
+async def test_max_entries_evicts_least_recently_used():
+    clock = Clock()
+    loader = Loader(clock)
+    cache = TrustScoreCache(max_entries=2, clock=clock)
+
+    await cache.get("a", loader)
+    await cache.get("b", loader)
+    await cache.get("a", loader)
+    await cache.get("c", loader)
+
+    assert len(cache) == 2
+    await cache.get("b", loader)
+    assert loader.calls == 4
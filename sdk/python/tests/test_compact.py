@@ -0,0 +1,121 @@
+"""
+Tests for the compact, slots-based model records
+"""
+
+import gc
+import tracemalloc
+from datetime import datetime, timezone
+
+import pytest
+
+from vauntico_sdk import (
+    CompactTrendSeries,
+    CompactTrustScore,
+    CompactUser,
+    SubscriptionTier,
+    TrendDataPoint,
+    TrendDirection,
+    TrustScoreResponse,
+    User,
+)
+
+
+def make_score(score: float = 72.5) -> TrustScoreResponse:
+    return TrustScoreResponse(
+        score=score,
+        tier="gold",
+        factors={"engagement": 1.5, "consistency": 2.5, "quality": 3.5, "community": 4.5},
+        calculatedAt="2026-01-01T00:00:00Z",
+        expiresAt="2026-01-01T01:00:00Z",
+        trend="up",
+        change=0.5,
+        lastUpdated="2026-01-01T00:00:00Z",
+    )
+
+
+def make_user(**overrides) -> User:
+    fields = {
+        "id": "user-1",
+        "email": "ada@example.com",
+        "username": "ada",
+        "displayName": "Ada",
+        "tier": "platinum",
+        "createdAt": "2025-06-01T12:00:00Z",
+        "lastLogin": "2026-01-01T08:30:00Z",
+        "verified": True,
+        **overrides,
+    }
+    return User(**fields)
+
+
+def allocated_per_item(build, count: int = 2000) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [build(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(items) == count
+    return (after - before) / count
+
+
+def test_trust_score_round_trips():
+    model = make_score()
+    record = CompactTrustScore.from_model(model)
+
+    assert record.tier is SubscriptionTier.GOLD
+    assert record.trend is TrendDirection.UP
+    assert record.to_model() == model
+
+
+def test_naive_datetimes_are_read_as_utc():
+    model = make_score()
+    naive = model.model_copy(update={"expires_at": datetime(2026, 1, 1, 1, 0)})
+
+    restored = CompactTrustScore.from_model(naive).to_model()
+
+    assert restored.expires_at == datetime(2026, 1, 1, 1, 0, tzinfo=timezone.utc)
+    assert restored.expires_at.tzinfo is not None
+
+
+@pytest.mark.parametrize("last_login", ["2026-01-01T08:30:00Z", None])
+def test_user_round_trips(last_login):
+    model = make_user(lastLogin=last_login)
+    record = CompactUser.from_model(model)
+
+    assert record.tier is SubscriptionTier.PLATINUM
+    assert (record.last_login is None) == (last_login is None)
+    assert record.to_model() == model
+
+
+def test_trend_series_indexing_and_slicing():
+    points = [
+        TrendDataPoint(date=f"2026-01-0{day}", score=float(day), benchmark=50.0)
+        for day in range(1, 6)
+    ]
+    series = CompactTrendSeries(points)
+
+    assert len(series) == 5
+    assert series[0] == points[0]
+    assert series[-1] == points[-1]
+    assert series[-5] == points[0]
+    assert series[1:4] == points[1:4]
+    assert series[::-2] == points[::-2]
+    assert series.to_models() == points
+
+    with pytest.raises(IndexError):
+        series[5]
+    with pytest.raises(IndexError):
+        series[-6]
+
+
+def test_compact_trust_score_is_a_fraction_of_the_model_size():
+    model_bytes = allocated_per_item(lambda i: make_score(float(i % 100)))
+    models = [make_score(float(i % 100)) for i in range(2000)]
+    record_bytes = allocated_per_item(lambda i: CompactTrustScore.from_model(models[i]))
+
+    # Roughly 1.8 KB per model against a little over 200 B per record
+    assert record_bytes < 300
+    assert record_bytes * 4 < model_bytes
@@ -0,0 +1,113 @@
+"""
+Tests for request body compression and transfer size metrics
+"""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from vauntico_sdk import (
+    CompressionStats,
+    TrustScoreCalculationRequest,
+    VaunticoApiClient,
+)
+from vauntico_sdk.compression import compress_json_body
+
+LARGE_PAYLOAD = {"events": [{"type": "post", "platform": "youtube"}] * 50}
+
+
+def test_small_payload_is_sent_raw():
+    body, headers, raw_size = compress_json_body({"a": 1}, threshold=1024)
+
+    assert body == b'{"a":1}'
+    assert "Content-Encoding" not in headers
+    assert raw_size == len(body)
+
+
+def test_large_payload_is_gzipped():
+    body, headers, raw_size = compress_json_body(LARGE_PAYLOAD, threshold=1024)
+
+    assert headers["Content-Encoding"] == "gzip"
+    assert len(body) < raw_size
+    assert json.loads(gzip.decompress(body)) == LARGE_PAYLOAD
+
+
+def test_payload_that_does_not_shrink_is_sent_raw():
+    payload = {"user": "u-1", "force": True, "factors": ["quality"]}
+    body, headers, raw_size = compress_json_body(payload, threshold=0)
+
+    assert "Content-Encoding" not in headers
+    assert len(body) == raw_size
+
+
+def test_gzip_output_is_identical_across_calls(monkeypatch):
+    first, _, _ = compress_json_body(LARGE_PAYLOAD, threshold=0)
+    monkeypatch.setattr(gzip.time, "time", lambda: 2_000_000_000.0)
+    second, _, _ = compress_json_body(LARGE_PAYLOAD, threshold=0)
+
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_stats_record_wire_and_decoded_response_bytes():
+    content = json.dumps(LARGE_PAYLOAD).encode("utf-8")
+    compressed = gzip.compress(content)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # A stream, unlike `content=`, is counted as downloaded bytes
+        return httpx.Response(
+            200, headers={"Content-Encoding": "gzip"}, stream=httpx.ByteStream(compressed)
+        )
+
+    stats = CompressionStats()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        stats.record_response(await client.get("http://api.test/"))
+
+    summary = stats.as_dict()
+    assert summary["responses"] == 1
+    assert summary["response_bytes_wire"] == len(compressed)
+    assert summary["response_bytes_decoded"] == len(content)
+    assert summary["response_ratio"] == len(compressed) / len(content)
+    assert summary["response_encodings"] == {"gzip": 1}
+
+
+@pytest.mark.asyncio
+async def test_client_gzips_large_request_bodies():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200, json={"data": {"calculationId": "c-1", "status": "processing", "estimatedTime": 5}}
+        )
+
+    client = VaunticoApiClient(
+        base_url="http://api.test",
+        transport=httpx.MockTransport(handler),
+        compression_threshold=64,
+    )
+    await client.calculate_trust_score(
+        TrustScoreCalculationRequest(userId="u" * 500)
+    )
+    await client.close()
+
+    request = seen[0]
+    assert request.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.content))["user_id"] == "u" * 500
+    assert client.compression_stats.requests_compressed == 1
+    assert client.compression_stats.request_bytes_sent == len(request.content)
+
+
+@pytest.mark.asyncio
+async def test_client_keeps_httpx_accept_encoding_unless_overridden():
+    default = httpx.AsyncClient().headers["accept-encoding"]
+
+    client = VaunticoApiClient()
+    overridden = VaunticoApiClient(headers={"Accept-Encoding": "identity"})
+
+    assert client.client.headers["accept-encoding"] == default
+    assert overridden.client.headers["accept-encoding"] == "identity"
+    await client.close()
+    await overridden.close()
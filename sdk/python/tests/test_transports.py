@@ -0,0 +1,162 @@
+"""
+Tests for the record/replay transports
+"""
+
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from vauntico_sdk import (
+    RecordingTransport,
+    ReplayMissError,
+    ReplayTransport,
+    VaunticoApiClient,
+)
+from vauntico_sdk import transports
+
+URL = "http://api.test/health"
+
+
+def write_cassette(path, entries, version=transports.CASSETTE_VERSION) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"version": version}) + "\n")
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def make_entry(body: str, elapsed: float = 0.0, url: str = URL) -> dict:
+    return {
+        "method": "GET",
+        "url": url,
+        "body_sha1": "",
+        "elapsed": elapsed,
+        "status": 200,
+        "headers": [["content-type", "application/json"]],
+        "body": body,
+    }
+
+
+class SleepRecorder:
+    """Stand-in for asyncio.sleep that records delays and the peak number of sleepers"""
+
+    def __init__(self) -> None:
+        self._sleep = asyncio.sleep
+        self.delays = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, delay: float) -> None:
+        self.delays.append(delay)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await self._sleep(0.01)
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filename", ["cassette.jsonl", "cassette.jsonl.gz"])
+async def test_gzip_response_round_trips_decoded(tmp_path, filename):
+    payload = {"status": "healthy", "services": {"db": "up"}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+            content=gzip.compress(json.dumps(payload).encode("utf-8")),
+        )
+
+    path = str(tmp_path / filename)
+    recorder = RecordingTransport(path, transport=httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=recorder) as client:
+        recorded = await client.get(URL)
+    assert recorded.json() == payload
+
+    entry = recorder.entries[0]
+    assert json.loads(entry["body"]) == payload
+    assert "content-encoding" not in {name.lower() for name, _ in entry["headers"]}
+
+    async with httpx.AsyncClient(transport=ReplayTransport(path, speed=0)) as client:
+        replayed = await client.get(URL)
+    assert replayed.status_code == 200
+    assert replayed.json() == payload
+    assert "content-encoding" not in replayed.headers
+
+
+@pytest.mark.asyncio
+async def test_repeated_requests_replay_in_order_and_wrap_around(tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    write_cassette(path, [make_entry('{"n": 1}'), make_entry('{"n": 2}')])
+
+    async with httpx.AsyncClient(transport=ReplayTransport(path, speed=0)) as client:
+        seen = [(await client.get(URL)).json()["n"] for _ in range(5)]
+
+    assert seen == [1, 2, 1, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_request_raises_replay_miss(tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    write_cassette(path, [make_entry("{}")])
+
+    async with httpx.AsyncClient(transport=ReplayTransport(path, speed=0)) as client:
+        with pytest.raises(ReplayMissError):
+            await client.get("http://api.test/other")
+
+
+@pytest.mark.asyncio
+async def test_client_lets_replay_miss_propagate(tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    write_cassette(path, [])
+
+    client = VaunticoApiClient(
+        base_url="http://api.test",
+        transport=ReplayTransport(path, speed=0),
+    )
+    with pytest.raises(ReplayMissError):
+        await client.health_check()
+    await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("speed, expected", [(0, []), (1, [0.2]), (4, [0.05])])
+async def test_recorded_latency_is_scaled_by_speed(tmp_path, monkeypatch, speed, expected):
+    path = str(tmp_path / "cassette.jsonl")
+    write_cassette(path, [make_entry("{}", elapsed=0.2)])
+    sleeps = SleepRecorder()
+    monkeypatch.setattr(transports.asyncio, "sleep", sleeps)
+
+    async with httpx.AsyncClient(transport=ReplayTransport(path, speed=speed)) as client:
+        await client.get(URL)
+
+    assert sleeps.delays == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency, peak", [(None, 6), (2, 2)])
+async def test_max_concurrency_limits_responses_in_flight(
+    tmp_path, monkeypatch, max_concurrency, peak
+):
+    path = str(tmp_path / "cassette.jsonl")
+    write_cassette(path, [make_entry("{}", elapsed=0.1)])
+    sleeps = SleepRecorder()
+    monkeypatch.setattr(transports.asyncio, "sleep", sleeps)
+
+    transport = ReplayTransport(path, max_concurrency=max_concurrency)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await asyncio.gather(*[client.get(URL) for _ in range(6)])
+
+    assert len(sleeps.delays) == 6
+    assert sleeps.peak == peak
+
+
+def test_unsupported_cassette_version_raises(tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    write_cassette(path, [], version=transports.CASSETTE_VERSION + 1)
+
+    with pytest.raises(ValueError):
+        ReplayTransport(path)